@@ -1,161 +1,200 @@
 from ask_sdk_core.dispatch_components import AbstractExceptionHandler, AbstractRequestHandler
 from ask_sdk_core.skill_builder import SkillBuilder
-from ask_sdk_core.handler_input import HandlerInput
-from ask_sdk_model import Response
 from ask_sdk_model.interfaces.alexa.presentation.apl import RenderDocumentDirective
 from ask_sdk_model.ui import StandardCard, SimpleCard
 import ask_sdk_core.utils as ask_utils
-import requests
+import httpx
 import logging
-import json
+import orjson
 from config import OPENAI_API_KEY, MODEL_CONFIG
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
-def get_api_key():
-    if not OPENAI_API_KEY or OPENAI_API_KEY == "YOUR_API_KEY":
-        logger.error("OpenAI API key not configured in config.py")
-        raise ValueError("OpenAI API key not configured")
-    return OPENAI_API_KEY
-
-def supports_apl(handler_input):
+# The key is fixed for the lifetime of the container, so validate it and bind the headers once
+_API_KEY_CONFIGURED = bool(OPENAI_API_KEY) and OPENAI_API_KEY != "YOUR_API_KEY"
+if not _API_KEY_CONFIGURED:
+    logger.error("OpenAI API key not configured in config.py")
+
+_OPENAI_URL = "https://api.openai.com/v1/chat/completions"
+_OPENAI_HEADERS = {
+    "Authorization": f"Bearer {OPENAI_API_KEY}",
+    "Content-Type": "application/json"
+}
+
+# Shared HTTP/2 client so warm invocations reuse the pooled TLS connection to OpenAI
+# The transport retries a failed or timed-out connect once, which is what the short connect timeout is for
+_CLIENT = httpx.Client(
+    transport=httpx.HTTPTransport(
+        http2=True,
+        retries=1,
+        limits=httpx.Limits(max_keepalive_connections=4, max_connections=10, keepalive_expiry=60)
+    ),
+    timeout=httpx.Timeout(9.0, connect=2.0)
+)
+
+# A single retry on 5xx reuses the warm connection instead of failing the turn
+_RETRY_STATUSES = frozenset([500, 502, 503, 504])
+
+def _prewarm_connection():
+    # Open the TLS connection during Lambda INIT so the first query skips the handshake
+    if not _API_KEY_CONFIGURED:
+        return
     try:
-        supported_interfaces = handler_input.request_envelope.context.system.device.supported_interfaces
-        has_apl = hasattr(supported_interfaces, 'alexa_presentation_apl')
-        logger.info(f"Device supports APL: {has_apl}")
-        return has_apl
+        _CLIENT.get("https://api.openai.com/v1/models", headers=_OPENAI_HEADERS, timeout=2.0)
     except Exception as e:
-        logger.error(f"Error checking APL support: {str(e)}", exc_info=True)
-        return False
-
-def create_apl_directive(handler_input, title, primary_text, secondary_text=None):
-    try:
-        if supports_apl(handler_input):
-            logger.info("Creating APL Sequence directive")
-            
-             # Create an APL document that uses Sequence
-            apl_document = {
-                "type": "APL",
-                "version": "1.5",
-                "theme": "dark",
-                "mainTemplate": {
-                    "parameters": [
-                        "payload"
-                    ],
-                    "items": [
-                        {
-                            "type": "Container",
-                            "width": "100%",
-                            "height": "100%",
-                            "items": [
-                                {
-                                    "type": "Sequence",
-                                    "width": "100%",
-                                    "height": "100%",
-                                    "data": "${payload}",
-                                    "numbered": false,
-                                    "scrollDirection": "vertical",
-                                    "backgroundVisible": false,
-                                    "items": [
-                                        {
-                                            "type": "Text",
-                                            "id": "titleText",
-                                            "width": "100vw",
-                                            "paddingTop": "40dp",
-                                            "paddingBottom": "20dp",
-                                            "textAlign": "center",
-                                            "textAlignVertical": "center",
-                                            "fontSize": "24dp",
-                                            "fontWeight": "bold",
-                                            "text": "${data.titleText}"
-                                        },
-                                        {
-                                            "type": "Text",
-                                            "id": "primaryText",
-                                            "width": "100vw",
-                                            "paddingLeft": "15dp",
-                                            "paddingRight": "15dp",
-                                            "paddingBottom": "20dp",
-                                            "textAlign": "left",
-                                            "fontSize": "20dp",
-                                            "text": "${data.primaryText}"
-                                        },
-                                        {
-                                            "type": "Text",
-                                            "id": "secondaryText",
-                                            "width": "100vw",
-                                            "paddingLeft": "15dp",
-                                            "paddingRight": "15dp",
-                                            "textAlign": "left",
-                                            "fontSize": "20dp",
-                                            "text": "${data.secondaryText}"
-                                        }
-                                    ]
-                                }
-                            ]
-                        }
-                    ]
-                }
-            }
-            
-            # Create datasources as an array for the Sequence
-            datasources = {
-                "payload": [
+        logger.warning("Could not pre-warm OpenAI connection: %s", e)
+
+_prewarm_connection()
+
+# Number of previous chat messages (five question/answer turns) sent to OpenAI and kept in the session
+_MAX_HISTORY = 10
+
+_SYSTEM_MSG = {"role": "system", "content": "You are a helpful assistant. Provide clear, concise answers. Keep responses under 50 words."}
+
+# APL document shared by every directive; only the datasources change per call
+_APL_DOCUMENT = {
+    "type": "APL",
+    "version": "1.5",
+    "theme": "dark",
+    "mainTemplate": {
+        "parameters": [
+            "payload"
+        ],
+        "items": [
+            {
+                "type": "Container",
+                "width": "100%",
+                "height": "100%",
+                "items": [
                     {
-                        "titleText": title,
-                        "primaryText": primary_text,
-                        "secondaryText": secondary_text or ""
+                        "type": "Sequence",
+                        "width": "100%",
+                        "height": "100%",
+                        "data": "${payload}",
+                        "numbered": False,
+                        "scrollDirection": "vertical",
+                        "backgroundVisible": False,
+                        "items": [
+                            {
+                                "type": "Text",
+                                "id": "titleText",
+                                "width": "100vw",
+                                "paddingTop": "40dp",
+                                "paddingBottom": "20dp",
+                                "textAlign": "center",
+                                "textAlignVertical": "center",
+                                "fontSize": "24dp",
+                                "fontWeight": "bold",
+                                "text": "${data.titleText}"
+                            },
+                            {
+                                "type": "Text",
+                                "id": "primaryText",
+                                "width": "100vw",
+                                "paddingLeft": "15dp",
+                                "paddingRight": "15dp",
+                                "paddingBottom": "20dp",
+                                "textAlign": "left",
+                                "fontSize": "20dp",
+                                "text": "${data.primaryText}"
+                            },
+                            {
+                                "type": "Text",
+                                "id": "secondaryText",
+                                "width": "100vw",
+                                "paddingLeft": "15dp",
+                                "paddingRight": "15dp",
+                                "textAlign": "left",
+                                "fontSize": "20dp",
+                                "text": "${data.secondaryText}"
+                            }
+                        ]
                     }
                 ]
             }
-            
-            logger.info(f"APL Sequence Document: {json.dumps(apl_document)[:200]}...")
-            logger.info(f"Sequence Datasources: {json.dumps(datasources)}")
-            
-            return RenderDocumentDirective(
-                token="token",
-                document=apl_document,
-                datasources=datasources
-            )
-        else:
-            return None
-            
-    except Exception as e:
-        logger.error(f"Error creating APL Directive: {str(e)}", exc_info=True)
-        return None
+        ]
+    }
+}
+
+def supports_apl(handler_input):
+    # Cached per request since both the query handler and build_response ask
+    request_attr = handler_input.attributes_manager.request_attributes
+    if "_apl_supported" in request_attr:
+        return request_attr["_apl_supported"]
+    supported_interfaces = handler_input.request_envelope.context.system.device.supported_interfaces
+    has_apl = getattr(supported_interfaces, 'alexa_presentation_apl', None) is not None
+    request_attr["_apl_supported"] = has_apl
+    return has_apl
+
+def create_apl_directive(title, primary_text, secondary_text=None):
+    # Datasources are an array for the Sequence; the document itself is shared
+    return RenderDocumentDirective(
+        token="token",
+        document=_APL_DOCUMENT,
+        datasources={"payload": [{"titleText": title, "primaryText": primary_text, "secondaryText": secondary_text or ""}]}
+    )
 
 def generate_gpt_response(chat_history, new_question):
     try:
-        api_key = get_api_key()
-        headers = {
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json"
-        }
-        url = "https://api.openai.com/v1/chat/completions"
-
-        messages = [{"role": "system", "content": "You are a helpful assistant. Provide clear, concise answers. Keep responses under 50 words."}]
-        for q, a in chat_history[-5:]:
-            messages.append({"role": "user", "content": q})
-            messages.append({"role": "assistant", "content": a})
-        messages.append({"role": "user", "content": new_question})
+        if not _API_KEY_CONFIGURED:
+            raise ValueError("OpenAI API key not configured")
+
+        # chat_history is stored in the OpenAI message format, so it is sent as-is
+        messages = [_SYSTEM_MSG, *chat_history[-_MAX_HISTORY:], {"role": "user", "content": new_question}]
 
         data = {"messages": messages, **MODEL_CONFIG}
-        logger.info(f"Sending request to OpenAI API")
-        res = requests.post(url, headers=headers, data=json.dumps(data), timeout=10)
-        
-        if res.ok:
-            response_text = res.json()['choices'][0]['message']['content'].strip()
-            logger.info(f"Received response from OpenAI API: {response_text[:50]}...")
+        logger.info("Sending request to OpenAI API")
+        body = orjson.dumps(data)
+        res = _CLIENT.post(_OPENAI_URL, headers=_OPENAI_HEADERS, content=body)
+        if res.status_code in _RETRY_STATUSES:
+            logger.warning("OpenAI returned %s, retrying once", res.status_code)
+            res = _CLIENT.post(_OPENAI_URL, headers=_OPENAI_HEADERS, content=body)
+
+        if res.is_success:
+            response_text = orjson.loads(res.content)['choices'][0]['message']['content'].strip()
+            logger.info("Received response from OpenAI API: %.50s...", response_text)
             return response_text
         else:
-            logger.error(f"OpenAI error: {res.status_code} - {res.text}")
+            logger.error("OpenAI error: %s - %s", res.status_code, res.text)
             return "I'm having trouble connecting right now. Please try again."
 
     except Exception as e:
-        logger.error(f"Error generating GPT response: {e}", exc_info=True)
+        logger.error("Error generating GPT response: %s", e, exc_info=True)
         return "I encountered an error processing your request."
 
+def build_response(handler_input, speak_output, card, directive, reprompt=None, end_session=False):
+    rb = handler_input.response_builder
+    rb.speak(speak_output)
+    if end_session:
+        rb.set_should_end_session(True)
+    elif reprompt:
+        rb.ask(reprompt)
+
+    # Always add a card for non-screen devices
+    rb.set_card(card)
+
+    # For devices with screens, add APL directive
+    if directive is not None and supports_apl(handler_input):
+        rb.add_directive(directive)
+
+    return rb.response
+
+# Fixed responses are built once at import and reused on every warm invocation
+_LAUNCH_CARD = StandardCard(
+    title="Welcome to ChatGPT",
+    text="ChatGPT Mode is now active.\n\nYou can ask me any question!\n\nI'm ready to help you find answers."
+)
+_LAUNCH_DIRECTIVE = create_apl_directive(
+    title="Welcome to ChatGPT",
+    primary_text="ChatGPT Mode is now active.\n\nYou can ask me any question!",
+    secondary_text="I'm ready to help you find answers."
+)
+_ERROR_CARD = SimpleCard(
+    title="Error Occurred",
+    content="Sorry, I had trouble doing what you asked. Please try again."
+)
+
 class LaunchRequestHandler(AbstractRequestHandler):
     def can_handle(self, handler_input):
         return ask_utils.is_request_type("LaunchRequest")(handler_input)
@@ -164,34 +203,7 @@ class LaunchRequestHandler(AbstractRequestHandler):
         speak_output = "Chat G.P.T. mode activated"
         handler_input.attributes_manager.session_attributes["chat_history"] = []
 
-        # Create response builder
-        rb = handler_input.response_builder
-        rb.speak(speak_output).ask(speak_output)
-
-        # Always add a card for non-screen devices
-        rb.set_card(
-            StandardCard(
-                title="Welcome to ChatGPT",
-                text="ChatGPT Mode is now active.\n\nYou can ask me any question!\n\nI'm ready to help you find answers."
-            )
-        )
-        
-        # For devices with screens, add APL directive
-        if supports_apl(handler_input):
-            logger.info("Launch - Device has APL capabilities")
-            directive = create_apl_directive(
-                handler_input,
-                title="Welcome to ChatGPT",
-                primary_text="ChatGPT Mode is now active.\n\nYou can ask me any question!",
-                secondary_text="I'm ready to help you find answers."
-            )
-            if directive:
-                rb.add_directive(directive)
-                logger.info("Added APL directive to launch response")
-            else:
-                logger.error("Failed to create APL directive")
-
-        return rb.response
+        return build_response(handler_input, speak_output, _LAUNCH_CARD, _LAUNCH_DIRECTIVE, reprompt=speak_output)
 
 class GptQueryIntentHandler(AbstractRequestHandler):
     def can_handle(self, handler_input):
@@ -201,211 +213,61 @@ class GptQueryIntentHandler(AbstractRequestHandler):
         query = handler_input.request_envelope.request.intent.slots["query"].value
         session_attr = handler_input.attributes_manager.session_attributes
         chat_history = session_attr.setdefault("chat_history", [])
+        # Sessions started before the message-dict format still hold [query, answer] pairs
+        if chat_history and not isinstance(chat_history[0], dict):
+            chat_history.clear()
 
-        logger.info(f"Processing query: {query}")
+        logger.info("Processing query: %s", query)
         response = generate_gpt_response(chat_history, query)
-        chat_history.append((query, response))
-
-        speak_output = f"{response} Would you like to ask another question?"
+        chat_history.append({"role": "user", "content": query})
+        chat_history.append({"role": "assistant", "content": response})
+        if len(chat_history) > _MAX_HISTORY:
+            del chat_history[:-_MAX_HISTORY]
 
-        # Create response builder
-        rb = handler_input.response_builder
-        rb.speak(speak_output).ask("Would you like to ask another question?")
-
-        # Always add a card for non-screen devices
-        rb.set_card(
-            StandardCard(
-                title="ChatGPT Response",
-                text=f"Question:\n{query}\n\nAnswer:\n{response}\n\nWould you like to ask another question?"
-            )
-        )
-        
-        # For devices with screens, add APL directive
+        # Only build the per-turn APL directive for devices that can render it
+        directive = None
         if supports_apl(handler_input):
-            logger.info("Query - Device has APL capabilities")
             directive = create_apl_directive(
-                handler_input,
                 title="ChatGPT Response",
                 primary_text=f"Question:\n{query}\n\nAnswer:\n{response}",
                 secondary_text="Would you like to ask another question?"
             )
-            if directive:
-                rb.add_directive(directive)
-                logger.info("Added APL directive to query response")
-            else:
-                logger.error("Failed to create APL directive")
-
-        return rb.response
-
-class YesIntentHandler(AbstractRequestHandler):
-    def can_handle(self, handler_input):
-        return ask_utils.is_intent_name("AMAZON.YesIntent")(handler_input)
-
-    def handle(self, handler_input):
-        speak_output = "What would you like to know?"
-
-        rb = handler_input.response_builder
-        rb.speak(speak_output).ask(speak_output)
-        
-        # Always add a card for non-screen devices
-        rb.set_card(
-            SimpleCard(
-                title="Ask Another Question",
-                content="What would you like to know?"
-            )
-        )
-
-        # For devices with screens, add APL directive
-        if supports_apl(handler_input):
-            logger.info("Yes - Device has APL capabilities")
-            directive = create_apl_directive(
-                handler_input,
-                title="Ask Another Question",
-                primary_text="What would you like to know?",
-                secondary_text="I'm ready to help!"
-            )
-            if directive:
-                rb.add_directive(directive)
-                logger.info("Added APL directive to yes response")
-            else:
-                logger.error("Failed to create APL directive")
-
-        return rb.response
 
-class NoIntentHandler(AbstractRequestHandler):
-    def can_handle(self, handler_input):
-        return ask_utils.is_intent_name("AMAZON.NoIntent")(handler_input)
-
-    def handle(self, handler_input):
-        speak_output = "Thanks for chatting! Goodbye."
-        
-        rb = handler_input.response_builder
-        rb.speak(speak_output).set_should_end_session(True)
-        
-        # Always add a card for non-screen devices
-        rb.set_card(
-            SimpleCard(
-                title="Goodbye",
-                content="Thanks for chatting! Have a great day!"
-            )
+        return build_response(
+            handler_input,
+            f"{response} Would you like to ask another question?",
+            StandardCard(
+                title="ChatGPT Response",
+                text=f"Question:\n{query}\n\nAnswer:\n{response}\n\nWould you like to ask another question?"
+            ),
+            directive,
+            reprompt="Would you like to ask another question?"
         )
 
-        # For devices with screens, add APL directive
-        if supports_apl(handler_input):
-            logger.info("No - Device has APL capabilities")
-            directive = create_apl_directive(
-                handler_input,
-                title="Goodbye",
-                primary_text="Thanks for chatting!",
-                secondary_text="Have a great day!"
-            )
-            if directive:
-                rb.add_directive(directive)
-                logger.info("Added APL directive to no response")
-            else:
-                logger.error("Failed to create APL directive")
-
-        return rb.response
-
-class HelpIntentHandler(AbstractRequestHandler):
-    def can_handle(self, handler_input):
-        return ask_utils.is_intent_name("AMAZON.HelpIntent")(handler_input)
-
-    def handle(self, handler_input):
-        speak_output = "You can ask me any question, and I'll use ChatGPT to provide an answer. Just speak your question clearly."
-        
-        rb = handler_input.response_builder.speak(speak_output).ask(speak_output)
-        
-        # Add a card
-        rb.set_card(
-            SimpleCard(
-                title="Help with ChatGPT",
-                content=speak_output
-            )
-        )
-        
-        # For devices with screens, add APL directive
-        if supports_apl(handler_input):
-            logger.info("Help - Device has APL capabilities")
-            directive = create_apl_directive(
-                handler_input,
-                title="How to Use ChatGPT",
-                primary_text="You can ask me any question, and I'll use ChatGPT to provide an answer.",
-                secondary_text="Just speak your question clearly."
-            )
-            if directive:
-                rb.add_directive(directive)
-                logger.info("Added APL directive to help response")
-                
-        return rb.response
+# Intents that only ever answer with fixed speech, card and APL text share one handler
+class StaticIntentHandler(AbstractRequestHandler):
+    def __init__(self, intent_names, speak_output, card_title, card_content, title, primary_text, secondary_text, end_session=False):
+        self.intent_names = intent_names
+        self.speak_output = speak_output
+        self.card = SimpleCard(title=card_title, content=card_content)
+        self.directive = create_apl_directive(title, primary_text, secondary_text)
+        self.end_session = end_session
 
-class CancelOrStopIntentHandler(AbstractRequestHandler):
     def can_handle(self, handler_input):
         return (
-            ask_utils.is_intent_name("AMAZON.CancelIntent")(handler_input) or
-            ask_utils.is_intent_name("AMAZON.StopIntent")(handler_input)
-        )
-
-    def handle(self, handler_input):
-        speak_output = "Leaving Chat G.P.T. mode"
-        
-        rb = handler_input.response_builder
-        rb.speak(speak_output).set_should_end_session(True)
-        
-        # Add a card
-        rb.set_card(
-            SimpleCard(
-                title="Goodbye",
-                content="Leaving ChatGPT Mode. Thanks for chatting!"
-            )
+            ask_utils.is_request_type("IntentRequest")(handler_input) and
+            ask_utils.get_intent_name(handler_input) in self.intent_names
         )
 
-        # For devices with screens, add APL directive
-        if supports_apl(handler_input):
-            logger.info("Cancel/Stop - Device has APL capabilities")
-            directive = create_apl_directive(
-                handler_input,
-                title="Goodbye",
-                primary_text="Leaving ChatGPT Mode",
-                secondary_text="Thanks for chatting!"
-            )
-            if directive:
-                rb.add_directive(directive)
-                logger.info("Added APL directive to cancel/stop response")
-
-        return rb.response
-
-class FallbackIntentHandler(AbstractRequestHandler):
-    def can_handle(self, handler_input):
-        return ask_utils.is_intent_name("AMAZON.FallbackIntent")(handler_input)
-
     def handle(self, handler_input):
-        speak_output = "I'm not sure what you're asking. You can ask me any question, and I'll try to provide an answer using ChatGPT."
-        
-        rb = handler_input.response_builder.speak(speak_output).ask(speak_output)
-        
-        # Add a card
-        rb.set_card(
-            SimpleCard(
-                title="I Didn't Understand",
-                content=speak_output
-            )
+        return build_response(
+            handler_input,
+            self.speak_output,
+            self.card,
+            self.directive,
+            reprompt=None if self.end_session else self.speak_output,
+            end_session=self.end_session
         )
-        
-        # For devices with screens, add APL directive
-        if supports_apl(handler_input):
-            logger.info("Fallback - Device has APL capabilities")
-            directive = create_apl_directive(
-                handler_input,
-                title="I Didn't Understand",
-                primary_text="I'm not sure what you're asking.",
-                secondary_text="You can ask me any question, and I'll try to provide an answer using ChatGPT."
-            )
-            if directive:
-                rb.add_directive(directive)
-                logger.info("Added APL directive to fallback response")
-                
-        return rb.response
 
 class SessionEndedRequestHandler(AbstractRequestHandler):
     def can_handle(self, handler_input):
@@ -416,11 +278,11 @@ class SessionEndedRequestHandler(AbstractRequestHandler):
         if hasattr(handler_input.request_envelope.request, 'reason'):
             reason = handler_input.request_envelope.request.reason
         
-        logger.info(f"Session ended with reason: {reason}")
+        logger.info("Session ended with reason: %s", reason)
         
         if hasattr(handler_input.request_envelope.request, 'error'):
             error = handler_input.request_envelope.request.error
-            logger.error(f"Session ended error details: {json.dumps(error.__dict__) if hasattr(error, '__dict__') else error}")
+            logger.error("Session ended error details: %s", orjson.dumps(error.__dict__, default=str).decode() if hasattr(error, '__dict__') else error)
             
         return handler_input.response_builder.response
 
@@ -432,28 +294,9 @@ class CatchAllExceptionHandler(AbstractExceptionHandler):
         logger.error(exception, exc_info=True)
         speak_output = "Sorry, I had trouble doing what you asked. Please try again."
 
+        # Keep the error path lean: skip the APL lookup that may be what failed
         rb = handler_input.response_builder.speak(speak_output).ask(speak_output)
-        
-        # Add a card
-        rb.set_card(
-            SimpleCard(
-                title="Error Occurred",
-                content="Sorry, I had trouble doing what you asked. Please try again."
-            )
-        )
-        
-        # For devices with screens, add APL directive
-        if supports_apl(handler_input):
-            directive = create_apl_directive(
-                handler_input,
-                title="Error Occurred",
-                primary_text="Sorry, I had trouble doing what you asked.",
-                secondary_text="Please try again."
-            )
-            if directive:
-                rb.add_directive(directive)
-                logger.info("Added APL directive to exception response")
-
+        rb.set_card(_ERROR_CARD)
         return rb.response
 
 # Create skill builder
@@ -462,11 +305,53 @@ sb = SkillBuilder()
 # Add request handlers
 sb.add_request_handler(LaunchRequestHandler())
 sb.add_request_handler(GptQueryIntentHandler())
-sb.add_request_handler(YesIntentHandler())
-sb.add_request_handler(NoIntentHandler())
-sb.add_request_handler(HelpIntentHandler())
-sb.add_request_handler(FallbackIntentHandler())
-sb.add_request_handler(CancelOrStopIntentHandler())
+sb.add_request_handler(StaticIntentHandler(
+    ("AMAZON.YesIntent",),
+    "What would you like to know?",
+    card_title="Ask Another Question",
+    card_content="What would you like to know?",
+    title="Ask Another Question",
+    primary_text="What would you like to know?",
+    secondary_text="I'm ready to help!"
+))
+sb.add_request_handler(StaticIntentHandler(
+    ("AMAZON.NoIntent",),
+    "Thanks for chatting! Goodbye.",
+    card_title="Goodbye",
+    card_content="Thanks for chatting! Have a great day!",
+    title="Goodbye",
+    primary_text="Thanks for chatting!",
+    secondary_text="Have a great day!",
+    end_session=True
+))
+sb.add_request_handler(StaticIntentHandler(
+    ("AMAZON.HelpIntent",),
+    "You can ask me any question, and I'll use ChatGPT to provide an answer. Just speak your question clearly.",
+    card_title="Help with ChatGPT",
+    card_content="You can ask me any question, and I'll use ChatGPT to provide an answer. Just speak your question clearly.",
+    title="How to Use ChatGPT",
+    primary_text="You can ask me any question, and I'll use ChatGPT to provide an answer.",
+    secondary_text="Just speak your question clearly."
+))
+sb.add_request_handler(StaticIntentHandler(
+    ("AMAZON.FallbackIntent",),
+    "I'm not sure what you're asking. You can ask me any question, and I'll try to provide an answer using ChatGPT.",
+    card_title="I Didn't Understand",
+    card_content="I'm not sure what you're asking. You can ask me any question, and I'll try to provide an answer using ChatGPT.",
+    title="I Didn't Understand",
+    primary_text="I'm not sure what you're asking.",
+    secondary_text="You can ask me any question, and I'll try to provide an answer using ChatGPT."
+))
+sb.add_request_handler(StaticIntentHandler(
+    ("AMAZON.CancelIntent", "AMAZON.StopIntent"),
+    "Leaving Chat G.P.T. mode",
+    card_title="Goodbye",
+    card_content="Leaving ChatGPT Mode. Thanks for chatting!",
+    title="Goodbye",
+    primary_text="Leaving ChatGPT Mode",
+    secondary_text="Thanks for chatting!",
+    end_session=True
+))
 sb.add_request_handler(SessionEndedRequestHandler())  # Add the SessionEndedRequestHandler
 
 # Add exception handler